@@ -3,22 +3,134 @@ import csv
 import io
 import re
 import math
+import os
 import sys
-from typing import Dict, List, Union, Tuple, Any
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from operator import itemgetter
+from pickle import PicklingError
+from typing import Dict, Iterator, List, NamedTuple, Optional, Union, Tuple, Any
 
-# Set console output encoding to UTF-8
-sys.stdout.reconfigure(encoding='utf-8') if hasattr(sys.stdout, 'reconfigure') else None
-
-# Alternative approach for older Python versions
-if not hasattr(sys.stdout, 'reconfigure'):
-    import codecs
+def _orjson_loads(data_str: str) -> Any:
+    """Decode JSON with orjson, retrying with json.loads on input it rejects."""
     try:
-        sys.stdout = codecs.getwriter('utf-8')(sys.stdout.buffer)
-    except AttributeError:
-        pass  # If running in an environment without buffer attribute
+        return orjson.loads(data_str)
+    except orjson.JSONDecodeError:
+        # orjson rejects NaN, Infinity and floats that overflow, which
+        # json.loads accepts; malformed input fails again there
+        return json.loads(data_str)
+
+# JSON decoder used by parse_input_data; orjson is optional and much faster.
+# pysimdjson is not tried: it measured well behind orjson on upload-sized
+# payloads, and only modestly ahead of json.loads.
+# orjson returns integers beyond 64 bits as floats, so such values lose
+# precision in the report; json.loads keeps them exact.
+try:
+    import orjson
+    _json_loads = _orjson_loads
+except ImportError:
+    _json_loads = json.loads
+
+# Markdown layout of a per-user report, filled in by generate_report.
+# %(input_block)s stands for the Input Data lines.
+REPORT_TEMPLATE = r"""# Health Monitoring Summary
+
+**User ID:** %(user_id)s
+
+---
+
+## Input Data:
+%(input_block)s
+
+---
+
+## Detailed Calculations:
+
+1. Predicted Activity Calculation:
+ - Formula: $$ \text{Predicted Activity} = \text{current_steps} \times \text{activity_intensity_factor} $$
+ - Steps: Multiply current_steps by activity_intensity_factor.
+ - Calculation: %(current_steps)s \times %(activity_intensity_factor)s = %(predicted_activity)s
+ - Calculated Value: **%(predicted_activity)s steps**
+
+2. Heart Rate Category:
+ - IF heart_rate < 60, THEN "Below Optimal".
+ - ELSE IF heart_rate between 60 and 100, THEN "Optimal".
+ - ELSE, "Above Optimal".
+ - Given heart_rate = %(heart_rate)s
+ - Result: **%(heart_rate_category)s**
+
+3. Environmental Quality Category:
+ - IF environmental_index ≥ 75, THEN "Good".
+ - ELSE IF environmental_index ≥ 50, THEN "Moderate".
+ - ELSE, "Poor".
+ - Given environmental_index = %(environmental_index)s
+ - Result: **%(environmental_quality)s**
+
+4. Ambient Temperature Impact:
+ - IF ambient_temperature between 15 and 25, THEN "Ideal Temperature".
+ - ELSE IF ambient_temperature < 15, THEN "Too Cold".
+ - ELSE, "Too Hot".
+ - Given ambient_temperature = %(ambient_temperature)s
+ - Result: **%(temperature_impact)s**
+
+5. Composite Fitness Score Calculation:
+ - Formula: $$ \text{Composite Fitness Score} = \left(\frac{\text{Predicted Activity}}{10000} \times 0.5\right) + \left(\text{Heart Rate Factor} \times 0.3\right) + \left(\text{Environmental Factor} \times 0.2\right) $$
+ - Steps:
+   1. Normalized activity: $%(predicted_activity)s \div 10000 \times 0.5 = %(normalized_activity)s$
+   2. Heart Rate Factor: Heart rate category is "%(heart_rate_category)s" which gives a factor of %(heart_factor_value)s
+      Heart component: $%(heart_factor_value)s \times 0.3 = %(heart_component)s$
+   3. Environmental Factor: Environmental quality is "%(environmental_quality)s" which gives a factor of %(env_factor_value)s
+      Environmental component: $%(env_factor_value)s \times 0.2 = %(env_component)s$
+   4. Composite Fitness Score: $%(normalized_activity)s + %(heart_component)s + %(env_component)s = %(composite_fitness_score)s$
+ - Calculated Value: **%(composite_fitness_score)s**
+
+---
+
+## Final Recommendation:
+
+- Recommendation: **%(recommendation)s**
+- Status: **%(status)s**
+"""
+
+# REPORT_TEMPLATE compiled to positional %s placeholders, plus a getter that
+# pulls the values out of a mapping in placeholder order; positional
+# substitution avoids parsing and looking up every %(name)s key per report
+_REPORT_FORMAT = re.sub(r"%\((\w+)\)s", "%s", REPORT_TEMPLATE)
+_report_values = itemgetter(*re.findall(r"%\((\w+)\)s", REPORT_TEMPLATE))
+
+class Metrics(NamedTuple):
+    """Calculated metrics for a single user, as produced by calculate_metrics."""
+    predicted_activity: float
+    heart_rate_category: str
+    environmental_quality: str
+    temperature_impact: str
+    normalized_activity: float
+    heart_component: float
+    env_component: float
+    composite_fitness_score: float
+    recommendation: str
+    status: str
 
 class HealthMonitorAI:
-    def __init__(self):
+    # Numeric fields converted from their CSV string form
+    _INT_FIELDS = ("current_steps", "heart_rate")
+    _FLOAT_FIELDS = ("ambient_temperature", "environmental_index", "activity_intensity_factor")
+    
+    # Composite score factor for each category
+    HR_FACTORS = {"Optimal": 1, "Below Optimal": 0.8, "Above Optimal": 0.7}
+    ENV_FACTORS = {"Good": 1, "Moderate": 0.8, "Poor": 0.6}
+    
+    # With parallel=True, batches at least this large have their reports
+    # built in worker processes
+    _PARALLEL_MIN_USERS = 5000
+    
+    def __init__(self, parallel: bool = False):
+        # Build reports for large batches in worker processes. Off by default:
+        # each task pickles this instance by reference to its module, which
+        # fails unless the module is in sys.modules under a name the workers
+        # can import too (loading HealthMonitor-AI.py by path does not do
+        # that); the reports are then built serially instead
+        self.parallel = parallel
         self.required_fields = [
             "user_id", "current_steps", "heart_rate", 
             "ambient_temperature", "environmental_index", 
@@ -48,38 +160,34 @@ class HealthMonitorAI:
         if len(data) == 0:
             return False, "ERROR: No data provided.", validation_results
             
-        # Check each record
+        # Check each record, noting missing fields as they are found
+        missing_fields = set()
         for i, record in enumerate(data):
             row_num = i + 1
-            missing_fields = []
-            invalid_fields = []
             
             # Check for missing fields
-            for field in self.required_fields:
-                if field not in record:
-                    missing_fields.append(field)
-            
-            if missing_fields:
-                error_msg = f"ERROR: Missing required field(s): {', '.join(missing_fields)} in row {row_num}."
+            missing = [field for field in self.required_fields if field not in record]
+            if missing:
+                missing_fields.update(missing)
+                error_msg = f"ERROR: Missing required field(s): {', '.join(missing)} in row {row_num}."
                 validation_results["errors"].append(error_msg)
                 continue
                 
             # Validate field types and values
+            invalid_fields = []
             if not isinstance(record["user_id"], str):
                 invalid_fields.append("user_id")
                 
             try:
-                steps = int(record["current_steps"])
-                if steps <= 0:
+                if int(record["current_steps"]) <= 0:
                     invalid_fields.append("current_steps")
-            except (ValueError, TypeError):
+            except (ValueError, TypeError, OverflowError):
                 invalid_fields.append("current_steps")
             
             try:
-                heart_rate = int(record["heart_rate"])
-                if heart_rate <= 0:
+                if int(record["heart_rate"]) <= 0:
                     invalid_fields.append("heart_rate")
-            except (ValueError, TypeError):
+            except (ValueError, TypeError, OverflowError):
                 invalid_fields.append("heart_rate")
                 
             try:
@@ -100,17 +208,16 @@ class HealthMonitorAI:
                     invalid_fields.append("activity_intensity_factor")
             except (ValueError, TypeError):
                 invalid_fields.append("activity_intensity_factor")
-                
+            
             if invalid_fields:
                 error_msg = f"ERROR: Invalid value for the field(s): {', '.join(invalid_fields)} in row {row_num}. Please correct and resubmit."
                 validation_results["errors"].append(error_msg)
         
         # Prepare validation check results
-        for field in self.required_fields:
-            if all(field in record for record in data):
-                validation_results["fields_check"][field] = "present"
-            else:
-                validation_results["fields_check"][field] = "missing"
+        validation_results["fields_check"] = {
+            field: "missing" if field in missing_fields else "present"
+            for field in self.required_fields
+        }
         
         # Check if validation passed
         validation_passed = len(validation_results["errors"]) == 0
@@ -152,43 +259,62 @@ class HealthMonitorAI:
             List of dictionaries, each representing a user record
         """
         data_str = data_str.strip()
+        # Dispatch on the first character rather than scanning the whole input
+        first_char = data_str[:1]
         
         try:
-            # Try parsing as JSON
-            if data_str.startswith("{"):
-                data_dict = json.loads(data_str)
-                if "users" in data_dict:
-                    return data_dict["users"]
-                return [data_dict]
-            # Try parsing as CSV
-            elif "," in data_str:
-                csv_data = list(csv.reader(io.StringIO(data_str)))
-                if len(csv_data) < 2:  # Need at least header and one data row
+            # Try parsing as JSON: an object, or a top-level array of records
+            if first_char == "{" or first_char == "[":
+                data_dict = _json_loads(data_str)
+                if isinstance(data_dict, list):
+                    records = data_dict
+                else:
+                    try:
+                        records = data_dict["users"]
+                    except KeyError:  # A single user record
+                        return [data_dict]
+                # Every record must be a JSON object
+                if not all(isinstance(record, dict) for record in records):
+                    return []
+                return records
+            # Try parsing as CSV (only the header line needs to contain a comma)
+            elif "," in data_str.partition("\n")[0]:
+                # Stream rows straight from the reader instead of materializing them.
+                # Batch parsers such as cisv return every row up front, which
+                # measured slower here once uploads reach tens of thousands of rows
+                rows = csv.reader(io.StringIO(data_str))
+                header = next(rows, None)
+                if header is None:
                     return []
                     
-                headers = [h.strip() for h in csv_data[0]]
+                headers = [h.strip() for h in header]
+                num_headers = len(headers)
                 records = []
                 
-                for i in range(1, len(csv_data)):
-                    if len(csv_data[i]) != len(headers):
+                # Numeric fields present in this header, resolved once for all rows
+                int_fields = [field for field in self._INT_FIELDS if field in headers]
+                float_fields = [field for field in self._FLOAT_FIELDS if field in headers]
+                _int = int
+                _float = float
+                
+                for row in rows:
+                    if len(row) != num_headers:
                         continue
                         
-                    record = {headers[j]: csv_data[i][j] for j in range(len(headers))}
+                    record = dict(zip(headers, row))
                     
                     # Convert numeric fields to appropriate types
-                    for field in ["current_steps", "heart_rate"]:
-                        if field in record:
-                            try:
-                                record[field] = int(record[field])
-                            except ValueError:
-                                pass
+                    for field in int_fields:
+                        try:
+                            record[field] = _int(record[field])
+                        except ValueError:
+                            pass
                     
-                    for field in ["ambient_temperature", "environmental_index", "activity_intensity_factor"]:
-                        if field in record:
-                            try:
-                                record[field] = float(record[field])
-                            except ValueError:
-                                pass
+                    for field in float_fields:
+                        try:
+                            record[field] = _float(record[field])
+                        except ValueError:
+                            pass
                     
                     records.append(record)
                 
@@ -203,29 +329,24 @@ class HealthMonitorAI:
         Calculate all required metrics for a user.
         
         Args:
-            user_data: Dictionary containing user data
+            user_data: Dictionary containing user data; it is only read, and
+                is referenced (not copied) as the result's "input_data"
             
         Returns:
-            Dictionary containing all calculated metrics
+            Dictionary containing the "input_data" and its "calculations"
+            as a Metrics tuple
         """
-        results = {
-            "input_data": user_data.copy(),
-            "calculations": {}
-        }
-        
         # 1. Predicted Activity Calculation
         predicted_activity = user_data["current_steps"] * user_data["activity_intensity_factor"]
-        results["calculations"]["predicted_activity"] = round(predicted_activity, 2)
         
         # 2. Heart Rate Category
         heart_rate = user_data["heart_rate"]
         if heart_rate < 60:
             heart_rate_category = "Below Optimal"
-        elif 60 <= heart_rate <= 100:
+        elif heart_rate <= 100:
             heart_rate_category = "Optimal"
         else:
             heart_rate_category = "Above Optimal"
-        results["calculations"]["heart_rate_category"] = heart_rate_category
         
         # 3. Environmental Quality Category
         env_index = user_data["environmental_index"]
@@ -235,36 +356,21 @@ class HealthMonitorAI:
             env_quality = "Moderate"
         else:
             env_quality = "Poor"
-        results["calculations"]["environmental_quality"] = env_quality
         
         # 4. Ambient Temperature Impact
         temp = user_data["ambient_temperature"]
-        if 15 <= temp <= 25:
-            temp_impact = "Ideal Temperature"
-        elif temp < 15:
+        if temp < 15:
             temp_impact = "Too Cold"
+        elif temp <= 25:
+            temp_impact = "Ideal Temperature"
         else:
             temp_impact = "Too Hot"
-        results["calculations"]["temperature_impact"] = temp_impact
         
         # 5. Composite Fitness Score
-        # Define factors
-        heart_rate_factors = {"Optimal": 1, "Below Optimal": 0.8, "Above Optimal": 0.7}
-        env_factors = {"Good": 1, "Moderate": 0.8, "Poor": 0.6}
-        
-        heart_rate_factor = heart_rate_factors[heart_rate_category]
-        env_factor = env_factors[env_quality]
-        
-        # Calculate components
         normalized_activity = (predicted_activity / 10000) * 0.5
-        heart_component = heart_rate_factor * 0.3
-        env_component = env_factor * 0.2
-        
+        heart_component = self.HR_FACTORS[heart_rate_category] * 0.3
+        env_component = self.ENV_FACTORS[env_quality] * 0.2
         composite_score = normalized_activity + heart_component + env_component
-        results["calculations"]["normalized_activity"] = round(normalized_activity, 2)
-        results["calculations"]["heart_component"] = round(heart_component, 2)
-        results["calculations"]["env_component"] = round(env_component, 2)
-        results["calculations"]["composite_fitness_score"] = round(composite_score, 2)
         
         # 6. Final Recommendation
         if (composite_score >= 0.75 and 
@@ -276,17 +382,30 @@ class HealthMonitorAI:
             recommendation = "Adjust fitness plan"
             status = "Needs Adjustment"
         
-        results["calculations"]["recommendation"] = recommendation
-        results["calculations"]["status"] = status
-        
-        return results
+        return {
+            "input_data": user_data,
+            # Positional arguments, in field order: keyword construction
+            # of a NamedTuple costs about twice as much
+            "calculations": Metrics(
+                round(predicted_activity, 2),
+                heart_rate_category,
+                env_quality,
+                temp_impact,
+                round(normalized_activity, 2),
+                round(heart_component, 2),
+                round(env_component, 2),
+                round(composite_score, 2),
+                recommendation,
+                status,
+            )
+        }
     
     def generate_report(self, metrics: Dict[str, Any]) -> str:
         """
         Generate the final report in markdown format.
         
         Args:
-            metrics: Dictionary containing all calculated metrics
+            metrics: Dictionary returned by calculate_metrics
             
         Returns:
             String containing the report in markdown format
@@ -294,76 +413,30 @@ class HealthMonitorAI:
         user_data = metrics["input_data"]
         calcs = metrics["calculations"]
         
-        report = f"# Health Monitoring Summary\n\n"
-        report += f"**User ID:** {user_data['user_id']}\n\n"
-        report += "---\n\n"
-        
-        # Input Data section
-        report += "## Input Data:\n"
-        for field in self.required_fields:
-            report += f"- {field}: {user_data[field]}\n"
-        
-        report += "\n---\n\n"
-        
-        # Detailed Calculations section
-        report += "## Detailed Calculations:\n\n"
-        
-        # 1. Predicted Activity
-        report += "1. Predicted Activity Calculation:\n"
-        report += " - Formula: $$ \\text{Predicted Activity} = \\text{current_steps} \\times \\text{activity_intensity_factor} $$\n"
-        report += " - Steps: Multiply current_steps by activity_intensity_factor.\n"
-        report += f" - Calculation: {user_data['current_steps']} \\times {user_data['activity_intensity_factor']} = {calcs['predicted_activity']}\n"
-        report += f" - Calculated Value: **{calcs['predicted_activity']} steps**\n\n"
-        
-        # 2. Heart Rate Category
-        report += "2. Heart Rate Category:\n"
-        report += " - IF heart_rate < 60, THEN \"Below Optimal\".\n"
-        report += " - ELSE IF heart_rate between 60 and 100, THEN \"Optimal\".\n"
-        report += " - ELSE, \"Above Optimal\".\n"
-        report += f" - Given heart_rate = {user_data['heart_rate']}\n"
-        report += f" - Result: **{calcs['heart_rate_category']}**\n\n"
-        
-        # 3. Environmental Quality
-        report += "3. Environmental Quality Category:\n"
-        report += " - IF environmental_index ≥ 75, THEN \"Good\".\n"
-        report += " - ELSE IF environmental_index ≥ 50, THEN \"Moderate\".\n"
-        report += " - ELSE, \"Poor\".\n"
-        report += f" - Given environmental_index = {user_data['environmental_index']}\n"
-        report += f" - Result: **{calcs['environmental_quality']}**\n\n"
-        
-        # 4. Temperature Impact
-        report += "4. Ambient Temperature Impact:\n"
-        report += " - IF ambient_temperature between 15 and 25, THEN \"Ideal Temperature\".\n"
-        report += " - ELSE IF ambient_temperature < 15, THEN \"Too Cold\".\n"
-        report += " - ELSE, \"Too Hot\".\n"
-        report += f" - Given ambient_temperature = {user_data['ambient_temperature']}\n"
-        report += f" - Result: **{calcs['temperature_impact']}**\n\n"
-        
-        # 5. Composite Fitness Score
-        report += "5. Composite Fitness Score Calculation:\n"
-        report += " - Formula: $$ \\text{Composite Fitness Score} = \\left(\\frac{\\text{Predicted Activity}}{10000} \\times 0.5\\right) + \\left(\\text{Heart Rate Factor} \\times 0.3\\right) + \\left(\\text{Environmental Factor} \\times 0.2\\right) $$\n"
-        
-        # Get factors based on categories
-        heart_factor_value = {"Optimal": 1, "Below Optimal": 0.8, "Above Optimal": 0.7}[calcs['heart_rate_category']]
-        env_factor_value = {"Good": 1, "Moderate": 0.8, "Poor": 0.6}[calcs['environmental_quality']]
-        
-        report += " - Steps:\n"
-        report += f"   1. Normalized activity: ${calcs['predicted_activity']} \\div 10000 \\times 0.5 = {calcs['normalized_activity']}$\n"
-        report += f"   2. Heart Rate Factor: Heart rate category is \"{calcs['heart_rate_category']}\" which gives a factor of {heart_factor_value}\n"
-        report += f"      Heart component: ${heart_factor_value} \\times 0.3 = {calcs['heart_component']}$\n"
-        report += f"   3. Environmental Factor: Environmental quality is \"{calcs['environmental_quality']}\" which gives a factor of {env_factor_value}\n"
-        report += f"      Environmental component: ${env_factor_value} \\times 0.2 = {calcs['env_component']}$\n"
-        report += f"   4. Composite Fitness Score: ${calcs['normalized_activity']} + {calcs['heart_component']} + {calcs['env_component']} = {calcs['composite_fitness_score']}$\n"
-        report += f" - Calculated Value: **{calcs['composite_fitness_score']}**\n\n"
-        
-        report += "---\n\n"
-        
-        # Final Recommendation
-        report += "## Final Recommendation:\n\n"
-        report += f"- Recommendation: **{calcs['recommendation']}**\n"
-        report += f"- Status: **{calcs['status']}**\n"
-        
-        return report
+        # Every REPORT_TEMPLATE placeholder must have a key here
+        return _REPORT_FORMAT % _report_values({
+            # Input Data lines follow required_fields as they are now
+            "input_block": "\n".join([f"- {field}: {user_data[field]}" for field in self.required_fields]),
+            "user_id": user_data["user_id"],
+            "current_steps": user_data["current_steps"],
+            "heart_rate": user_data["heart_rate"],
+            "ambient_temperature": user_data["ambient_temperature"],
+            "environmental_index": user_data["environmental_index"],
+            "activity_intensity_factor": user_data["activity_intensity_factor"],
+            "predicted_activity": calcs.predicted_activity,
+            "heart_rate_category": calcs.heart_rate_category,
+            "environmental_quality": calcs.environmental_quality,
+            "temperature_impact": calcs.temperature_impact,
+            "normalized_activity": calcs.normalized_activity,
+            "heart_component": calcs.heart_component,
+            "env_component": calcs.env_component,
+            "composite_fitness_score": calcs.composite_fitness_score,
+            "recommendation": calcs.recommendation,
+            "status": calcs.status,
+            # Get factors based on categories
+            "heart_factor_value": self.HR_FACTORS[calcs.heart_rate_category],
+            "env_factor_value": self.ENV_FACTORS[calcs.environmental_quality],
+        })
     
     def process_data(self, data_str: str) -> str:
         """
@@ -375,32 +448,97 @@ class HealthMonitorAI:
         Returns:
             String containing either validation errors or the final report
         """
+        return "".join(self.process_data_iter(data_str))
+    
+    def process_data_iter(self, data_str: str) -> Iterator[str]:
+        """
+        Process data and stream the final output in chunks.
+        
+        Only one user's report is held in memory at a time; joined together,
+        the chunks equal the string returned by process_data.
+        
+        Args:
+            data_str: String containing the data in either CSV or JSON format
+            
+        Yields:
+            Chunks of either the validation errors or the final report
+        """
         # Parse input data
         data = self.parse_input_data(data_str)
         
         if not data:
-            return "ERROR: Invalid data format. Please provide data in CSV or JSON format."
+            yield "ERROR: Invalid data format. Please provide data in CSV or JSON format."
+            return
         
-        # Validate data
+        # Validate every record before emitting anything, since a single
+        # invalid row replaces the whole output with the validation report
         valid, validation_report, _ = self.validate_data(data)
         
         if not valid:
-            return validation_report
-        
-        # Process each user record
-        results = []
-        for user_data in data:
-            metrics = self.calculate_metrics(user_data)
-            report = self.generate_report(metrics)
-            results.append(report)
-        
-        # Return all reports concatenated with a separator
-        return "\n\n" + "\n\n---\n\n".join(results)
+            yield validation_report
+            return
+        
+        # Emit each user's report with a separator between them
+        reports = None
+        if self.parallel and len(data) >= self._PARALLEL_MIN_USERS:
+            workers = self._available_cpus()
+            if workers > 1:
+                reports = self._parallel_reports(data, workers)
+        if reports is None:
+            reports = map(self._report_for_user, data)
+        
+        separator = "\n\n"
+        for report in reports:
+            yield separator
+            yield report
+            separator = "\n\n---\n\n"
+    
+    def _report_for_user(self, user_data: Dict[str, Any]) -> str:
+        """Calculate the metrics for one validated record and render its report."""
+        return self.generate_report(self.calculate_metrics(user_data))
+    
+    @staticmethod
+    def _available_cpus() -> int:
+        """Count the CPUs this process may run on."""
+        if hasattr(os, "sched_getaffinity"):
+            return len(os.sched_getaffinity(0))
+        return os.cpu_count() or 1
+    
+    def _parallel_reports(self, data: List[Dict[str, Any]], workers: int) -> Iterator[str]:
+        """Build reports across a process pool, yielding them in input order."""
+        chunksize = max(1, len(data) // (workers * 4))
+        done = 0
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                for report in executor.map(self._report_for_user, data, chunksize=chunksize):
+                    yield report
+                    done += 1
+        except (PicklingError, BrokenProcessPool):
+            # The task could not be pickled here or unpickled in a worker;
+            # build the reports not yet yielded in this process
+            yield from map(self._report_for_user, data[done:])
+
+def _ensure_utf8_stdout():
+    """Set console output encoding to UTF-8 unless it already is."""
+    encoding = getattr(sys.stdout, 'encoding', None) or ''
+    if encoding.lower() in ('utf-8', 'utf8'):
+        return
+    
+    if hasattr(sys.stdout, 'reconfigure'):
+        sys.stdout.reconfigure(encoding='utf-8')
+    else:
+        # Alternative approach for older Python versions
+        import codecs
+        try:
+            sys.stdout = codecs.getwriter('utf-8')(sys.stdout.buffer)
+        except AttributeError:
+            pass  # If running in an environment without buffer attribute
 
 def main():
     """
     Main function to handle user interaction.
     """
+    _ensure_utf8_stdout()
     monitor = HealthMonitorAI()
     sample_data = """user_id,current_steps,heart_rate,ambient_temperature,environmental_index,activity_intensity_factor
 U41,7100,75,20,80,1.1
@@ -415,9 +553,10 @@ U49,9100,92,24,77,1.1
 U50,9800,88,19,82,1.0"""
 
         
-    result = monitor.process_data(sample_data)
     print("\nResult:")
-    print(result)
+    for chunk in monitor.process_data_iter(sample_data):
+        sys.stdout.write(chunk)
+    sys.stdout.write("\n")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
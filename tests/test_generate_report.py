@@ -0,0 +1,48 @@
+import importlib.util
+import os
+import unittest
+
+# HealthMonitor-AI.py is a script whose name is not importable, so load it by path
+_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "HealthMonitor-AI.py")
+_spec = importlib.util.spec_from_file_location("healthmonitor_ai", _PATH)
+healthmonitor_ai = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(healthmonitor_ai)
+
+RECORD = {
+    "user_id": "U1",
+    "current_steps": 8000,
+    "heart_rate": 75,
+    "ambient_temperature": 20,
+    "environmental_index": 80,
+    "activity_intensity_factor": 1.1,
+}
+
+
+class TestGenerateReport(unittest.TestCase):
+    def setUp(self):
+        self.monitor = healthmonitor_ai.HealthMonitorAI()
+
+    def input_lines(self, report):
+        section = report.split("## Input Data:\n", 1)[1].split("\n\n---", 1)[0]
+        return section.split("\n")
+
+    def test_report_fills_every_placeholder(self):
+        report = self.monitor.generate_report(self.monitor.calculate_metrics(RECORD))
+        self.assertNotIn("%", report)
+        self.assertIn("- Calculation: 8000 \\times 1.1 = 8800.0", report)
+        self.assertIn("which gives a factor of 1\n", report)
+        self.assertIn("- Recommendation: **Continue current fitness plan**", report)
+
+    def test_input_data_follows_required_fields(self):
+        report = self.monitor.generate_report(self.monitor.calculate_metrics(RECORD))
+        self.assertEqual(self.input_lines(report), [f"- {field}: {RECORD[field]}" for field in self.monitor.required_fields])
+
+    def test_input_data_follows_required_fields_changed_after_init(self):
+        self.monitor.required_fields.append("device")
+        record = dict(RECORD, device="watch")
+        report = self.monitor.generate_report(self.monitor.calculate_metrics(record))
+        self.assertEqual(self.input_lines(report)[-1], "- device: watch")
+
+
+if __name__ == "__main__":
+    unittest.main()
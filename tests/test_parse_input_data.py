@@ -0,0 +1,59 @@
+import importlib.util
+import json
+import os
+import unittest
+
+# HealthMonitor-AI.py is a script whose name is not importable, so load it by path
+_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "HealthMonitor-AI.py")
+_spec = importlib.util.spec_from_file_location("healthmonitor_ai", _PATH)
+healthmonitor_ai = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(healthmonitor_ai)
+
+INVALID_FORMAT = "ERROR: Invalid data format. Please provide data in CSV or JSON format."
+
+RECORD = {
+    "user_id": "U1",
+    "current_steps": 8000,
+    "heart_rate": 75,
+    "ambient_temperature": 20,
+    "environmental_index": 80,
+    "activity_intensity_factor": 1.1,
+}
+
+
+class TestJsonArrayInput(unittest.TestCase):
+    def setUp(self):
+        self.monitor = healthmonitor_ai.HealthMonitorAI()
+
+    def test_array_of_records_is_parsed(self):
+        self.assertEqual(self.monitor.parse_input_data(json.dumps([RECORD])), [RECORD])
+        self.assertIn("**User ID:** U1", self.monitor.process_data(json.dumps([RECORD])))
+
+    def test_array_with_non_record_elements_is_invalid_format(self):
+        for data_str in ("[1, 2]", "[null]", json.dumps([RECORD, "U2"])):
+            with self.subTest(data_str=data_str):
+                self.assertEqual(self.monitor.parse_input_data(data_str), [])
+                self.assertEqual(self.monitor.process_data(data_str), INVALID_FORMAT)
+
+    def test_users_list_with_non_record_elements_is_invalid_format(self):
+        self.assertEqual(self.monitor.process_data('{"users": [1, 2]}'), INVALID_FORMAT)
+
+
+class TestJsonNumbers(unittest.TestCase):
+    def setUp(self):
+        self.monitor = healthmonitor_ai.HealthMonitorAI()
+
+    def test_non_finite_numbers_decode_like_json_loads(self):
+        for value in ("NaN", "Infinity", "-Infinity", "1e400"):
+            with self.subTest(value=value):
+                data_str = '{"users": [{"user_id": "U1", "ambient_temperature": %s}]}' % value
+                expected = json.loads(data_str)["users"]
+                parsed = self.monitor.parse_input_data(data_str)
+                self.assertEqual(repr(parsed), repr(expected))
+
+    def test_malformed_json_is_invalid_format(self):
+        self.assertEqual(self.monitor.process_data('{"users": [NaN'), INVALID_FORMAT)
+
+
+if __name__ == "__main__":
+    unittest.main()
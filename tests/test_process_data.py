@@ -0,0 +1,52 @@
+import importlib.util
+import json
+import os
+import sys
+import unittest
+from unittest import mock
+
+# HealthMonitor-AI.py is a script whose name is not importable, so load it by path
+_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "HealthMonitor-AI.py")
+_spec = importlib.util.spec_from_file_location("healthmonitor_ai", _PATH)
+healthmonitor_ai = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(healthmonitor_ai)
+
+RECORDS = [
+    {
+        "user_id": f"U{i}",
+        "current_steps": 5000 + i,
+        "heart_rate": 50 + i % 60,
+        "ambient_temperature": 10 + i % 20,
+        "environmental_index": i % 100,
+        "activity_intensity_factor": 1.1,
+    }
+    for i in range(200)
+]
+
+
+class TestParallelReports(unittest.TestCase):
+    def setUp(self):
+        # Take the pool path even on a single-CPU machine
+        cpus = mock.patch.object(healthmonitor_ai.HealthMonitorAI, "_available_cpus", return_value=2)
+        cpus.start()
+        self.addCleanup(cpus.stop)
+        self.data_str = json.dumps({"users": RECORDS})
+        self.expected = healthmonitor_ai.HealthMonitorAI().process_data(self.data_str)
+
+    def process_parallel(self):
+        monitor = healthmonitor_ai.HealthMonitorAI(parallel=True)
+        monitor._PARALLEL_MIN_USERS = len(RECORDS)
+        return monitor.process_data(self.data_str)
+
+    def test_parallel_output_matches_serial(self):
+        # Registered by name, so the workers can be handed this module's instances
+        with mock.patch.dict(sys.modules, {"healthmonitor_ai": healthmonitor_ai}):
+            self.assertEqual(self.process_parallel(), self.expected)
+
+    def test_falls_back_to_serial_when_module_is_not_importable(self):
+        self.assertNotIn("healthmonitor_ai", sys.modules)
+        self.assertEqual(self.process_parallel(), self.expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
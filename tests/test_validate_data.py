@@ -0,0 +1,51 @@
+import importlib.util
+import os
+import unittest
+
+# HealthMonitor-AI.py is a script whose name is not importable, so load it by path
+_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "HealthMonitor-AI.py")
+_spec = importlib.util.spec_from_file_location("healthmonitor_ai", _PATH)
+healthmonitor_ai = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(healthmonitor_ai)
+
+HEADER = "user_id,current_steps,heart_rate,ambient_temperature,environmental_index,activity_intensity_factor"
+
+
+class TestValidateData(unittest.TestCase):
+    def setUp(self):
+        self.monitor = healthmonitor_ai.HealthMonitorAI()
+
+    def validate_row(self, row):
+        return self.monitor.validate_data(self.monitor.parse_input_data(HEADER + "\n" + row))
+
+    def test_valid_row(self):
+        valid, _, results = self.validate_row("U1,8000,75,20,80,1.1")
+        self.assertTrue(valid)
+        self.assertEqual(results["errors"], [])
+
+    def test_large_and_non_finite_numbers_are_valid(self):
+        for row in ("U1,99999999999999999999,75,20,80,1.1",
+                    "U1,8000,75,1e30,80,1.1",
+                    "U1,8000,75,inf,80,1.1",
+                    "U1,8000,75,20,80,inf"):
+            with self.subTest(row=row):
+                self.assertTrue(self.validate_row(row)[0])
+
+    def test_invalid_values_are_reported(self):
+        valid, _, results = self.validate_row("U1,0,abc,hot,101,-1")
+        self.assertFalse(valid)
+        self.assertEqual(results["errors"], [
+            "ERROR: Invalid value for the field(s): current_steps, heart_rate, ambient_temperature, "
+            "environmental_index, activity_intensity_factor in row 1. Please correct and resubmit."
+        ])
+
+    def test_missing_fields_are_reported(self):
+        data = self.monitor.parse_input_data('{"users": [{"user_id": "U1", "current_steps": 8000}]}')
+        valid, _, results = self.monitor.validate_data(data)
+        self.assertFalse(valid)
+        self.assertEqual(results["fields_check"]["heart_rate"], "missing")
+        self.assertEqual(results["fields_check"]["user_id"], "present")
+
+
+if __name__ == "__main__":
+    unittest.main()